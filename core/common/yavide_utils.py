@@ -7,13 +7,14 @@ file_type_dict = {
     'Cxx': ['.c', '.cpp', '.cc', '.h', '.hh', '.hpp'],
     'Java': ['.java'] }
 
+file_type_to_lang_dict = dict(
+    (file_type, lang) for lang, file_types in file_type_dict.iteritems() for file_type in file_types
+)
+
 class YavideUtils():
     @staticmethod
     def file_type_to_programming_language(file_type):
-        for lang, file_types in file_type_dict.iteritems():
-            if file_type in file_types:
-                return lang
-        return ''
+        return file_type_to_lang_dict.get(file_type, '')
 
     @staticmethod
     def programming_language_to_extension(programming_language):